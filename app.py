@@ -2,8 +2,10 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from collections import namedtuple
 from datetime import datetime
 import numpy as np
+import os
 
 # Configuration de la page
 st.set_page_config(
@@ -18,262 +20,513 @@ st.title("🚗 Analyse des Prix BMW Z3")
 st.markdown("---")
 
 # Chargement des données
+# Bornes des filtres, calculées une seule fois au chargement
+Bounds = namedtuple('Bounds', [
+    'date_min', 'date_max', 'annee_min', 'annee_max',
+    'km_min', 'km_max', 'prix_min', 'prix_max'
+])
+
 @st.cache_data
 def load_data():
-    df = pd.read_csv('data.csv')
-    
-    # Conversion de la date au format datetime
-    df['date_publication'] = pd.to_datetime(df['date_publication'], format='%d/%m/%Y')
-    
-    # Nettoyage des données
-    df = df.dropna(subset=['prix_eur', 'date_publication'])
-    
-    return df
+    # Cache Parquet sur disque : le parsing CSV + dates n'est payé qu'une
+    # fois, les démarrages suivants lisent du binaire colonnaire déjà typé
+    if os.path.exists('data.parquet') and os.path.getmtime('data.parquet') >= os.path.getmtime('data.csv'):
+        df = pd.read_parquet('data.parquet')
+    else:
+        # Lecture multithreadée via pyarrow, avec schéma explicite plutôt que
+        # l'inférence de types et les int64/object par défaut. Les colonnes
+        # texte répétitives passent en Categorical (codes int8 + petit tableau
+        # de catégories), isin/groupby deviennent des opérations entières.
+        df = pd.read_csv(
+            'data.csv',
+            engine='pyarrow',
+            dtype={
+                'annee': 'int16',
+                'kilometrage_km': 'int32',
+                'prix_eur': 'int32',
+                'type_vendeur': 'category',
+                'ville': 'category'
+            }
+        )
 
-# Charger les données
-try:
-    df = load_data()
-    
-    # Sidebar - Filtres
-    st.sidebar.header("🔍 Filtres")
-    
-    # Filtre par date de publication
-    st.sidebar.subheader("Date de publication")
-    date_min = df['date_publication'].min().date()
-    date_max = df['date_publication'].max().date()
-    
-    date_range = st.sidebar.date_input(
-        "Période",
-        value=(date_min, date_max),
-        min_value=date_min,
-        max_value=date_max
-    )
-    
-    # Filtre par année de fabrication
-    st.sidebar.subheader("Année de fabrication")
-    annee_min = int(df['annee'].min())
-    annee_max = int(df['annee'].max())
-    annee_range = st.sidebar.slider(
-        "Année",
-        min_value=annee_min,
-        max_value=annee_max,
-        value=(annee_min, annee_max)
-    )
-    
-    # Filtre par kilométrage
-    st.sidebar.subheader("Kilométrage")
-    km_min = int(df['kilometrage_km'].min())
-    km_max = int(df['kilometrage_km'].max())
-    km_range = st.sidebar.slider(
-        "Kilométrage (km)",
-        min_value=km_min,
-        max_value=km_max,
-        value=(km_min, km_max),
-        step=1000
-    )
-    
-    # Filtre par prix
-    st.sidebar.subheader("Prix")
-    prix_min = int(df['prix_eur'].min())
-    prix_max = int(df['prix_eur'].max())
-    prix_range = st.sidebar.slider(
-        "Prix (€)",
-        min_value=prix_min,
-        max_value=prix_max,
-        value=(prix_min, prix_max),
-        step=500
-    )
-    
-    # Filtre par type de vendeur
-    st.sidebar.subheader("Type de vendeur")
-    type_vendeur = st.sidebar.multiselect(
-        "Sélectionner",
-        options=df['type_vendeur'].unique(),
-        default=df['type_vendeur'].unique()
+        # Conversion de la date au format datetime (le format jour/mois/année
+        # n'est pas reconnu par le parseur de dates pyarrow)
+        df['date_publication'] = pd.to_datetime(df['date_publication'], format='%d/%m/%Y')
+
+        # Nettoyage des données
+        df = df.dropna(subset=['prix_eur', 'date_publication'])
+
+        df.to_parquet('data.parquet')
+
+    # Bornes calculées ici, sous le cache : les sliders ne déclenchent plus
+    # quatre scans min/max de colonnes à chaque rerun
+    bounds = Bounds(
+        date_min=df['date_publication'].min().date(),
+        date_max=df['date_publication'].max().date(),
+        annee_min=int(df['annee'].min()),
+        annee_max=int(df['annee'].max()),
+        km_min=int(df['kilometrage_km'].min()),
+        km_max=int(df['kilometrage_km'].max()),
+        prix_min=int(df['prix_eur'].min()),
+        prix_max=int(df['prix_eur'].max())
     )
-    
-    # Application des filtres
-    df_filtered = df.copy()
-    
-    if len(date_range) == 2:
-        df_filtered = df_filtered[
-            (df_filtered['date_publication'].dt.date >= date_range[0]) &
-            (df_filtered['date_publication'].dt.date <= date_range[1])
+
+    return df, bounds
+
+# Numba est une dépendance optionnelle : si présente, les huit comparaisons
+# du filtre sont fusionnées en une seule boucle parallèle sur les tableaux
+# bruts, une seule passe mémoire au lieu d'un masque numpy par critère
+try:
+    from numba import njit, prange
+except ImportError:
+    _build_mask = None
+else:
+    @njit(parallel=True, cache=True)
+    def _build_mask(date_i8, annee, km, prix, vendeur, d_lo, d_hi,
+                    a_lo, a_hi, k_lo, k_hi, p_lo, p_hi, vendeur_autorise):
+        out = np.empty(date_i8.size, np.bool_)
+        for i in prange(date_i8.size):
+            out[i] = (
+                date_i8[i] >= d_lo and date_i8[i] < d_hi and
+                annee[i] >= a_lo and annee[i] <= a_hi and
+                km[i] >= k_lo and km[i] <= k_hi and
+                prix[i] >= p_lo and prix[i] <= p_hi and
+                vendeur[i] >= 0 and vendeur_autorise[vendeur[i]]
+            )
+        return out
+
+# Filtrage mis en cache : le DataFrame source et les colonnes SoA sont
+# passés avec un underscore (non hashés), la clé de cache est le tuple de
+# filtres
+@st.cache_data
+def apply_filters(_df, _cols, date_key, annee_range, km_range, prix_range, type_vendeur_key):
+    date_arr = _cols['date']
+    annee_arr = _cols['annee']
+    km_arr = _cols['km']
+    prix_arr = _cols['prix']
+    vendeur_codes = _cols['vendeur']
+    codes_selectionnes = _df['type_vendeur'].cat.categories.get_indexer(type_vendeur_key)
+
+    if len(date_key) == 2:
+        # Intervalle semi-ouvert [lo, hi+1j) : inclut toute la journée de
+        # fin même si les timestamps ne sont pas à minuit
+        date_lo = np.datetime64(date_key[0])
+        date_hi = np.datetime64(date_key[1]) + np.timedelta64(1, 'D')
+    else:
+        date_lo = date_hi = None
+
+    if _build_mask is not None:
+        autorises = np.zeros(len(_df['type_vendeur'].cat.categories), np.bool_)
+        autorises[codes_selectionnes[codes_selectionnes >= 0]] = True
+        # Bornes converties dans la résolution native du tableau de dates
+        # (ns sous pandas 2.x, us sous pandas 3.x) : la vue i8 et les bornes
+        # doivent compter dans la même unité
+        d_lo = np.iinfo(np.int64).min if date_lo is None \
+            else date_lo.astype(date_arr.dtype).astype(np.int64)
+        d_hi = np.iinfo(np.int64).max if date_hi is None \
+            else date_hi.astype(date_arr.dtype).astype(np.int64)
+        mask = _build_mask(
+            date_arr.view(np.int64), annee_arr, km_arr, prix_arr, vendeur_codes,
+            d_lo, d_hi,
+            annee_range[0], annee_range[1],
+            km_range[0], km_range[1],
+            prix_range[0], prix_range[1],
+            autorises
+        )
+    else:
+        masks = [
+            annee_arr >= annee_range[0],
+            annee_arr <= annee_range[1],
+            km_arr >= km_range[0],
+            km_arr <= km_range[1],
+            prix_arr >= prix_range[0],
+            prix_arr <= prix_range[1],
+            np.isin(vendeur_codes, codes_selectionnes)
         ]
-    
-    df_filtered = df_filtered[
-        (df_filtered['annee'] >= annee_range[0]) &
-        (df_filtered['annee'] <= annee_range[1]) &
-        (df_filtered['kilometrage_km'] >= km_range[0]) &
-        (df_filtered['kilometrage_km'] <= km_range[1]) &
-        (df_filtered['prix_eur'] >= prix_range[0]) &
-        (df_filtered['prix_eur'] <= prix_range[1]) &
-        (df_filtered['type_vendeur'].isin(type_vendeur))
-    ]
-    
-    # Statistiques principales
-    st.header("📊 Statistiques Clés")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Nombre d'annonces", len(df_filtered))
-    
-    with col2:
-        st.metric("Prix moyen", f"{df_filtered['prix_eur'].mean():,.0f} €")
-    
-    with col3:
-        st.metric("Prix médian", f"{df_filtered['prix_eur'].median():,.0f} €")
-    
-    with col4:
-        st.metric("Kilométrage moyen", f"{df_filtered['kilometrage_km'].mean():,.0f} km")
-    
-    st.markdown("---")
-    
-    # Graphique principal : Prix en fonction du temps
-    st.header("📈 Évolution des Prix au Fil du Temps")
-    
-    fig_time = px.scatter(
-        df_filtered.sort_values('date_publication'),
-        x='date_publication',
-        y='prix_eur',
-        color='type_vendeur',
-        size='kilometrage_km',
-        hover_data=['titre', 'annee', 'kilometrage_km', 'ville'],
-        title="Prix des BMW Z3 par Date de Publication",
-        labels={
-            'date_publication': 'Date de Publication',
-            'prix_eur': 'Prix (€)',
-            'type_vendeur': 'Type de Vendeur',
-            'kilometrage_km': 'Kilométrage (km)'
-        },
-        color_discrete_map={
+
+        if date_lo is not None:
+            masks.append(date_arr >= date_lo)
+            masks.append(date_arr < date_hi)
+
+        mask = np.logical_and.reduce(masks)
+
+    return _df[mask]
+
+@st.cache_data
+def build_time_figure(_df_filtered, filter_key):
+    # Une seule trace WebGL : le rendu canvas est bien plus rapide que le SVG
+    # par point de px.scatter. Le tri est fait une seule fois et réutilisé
+    # pour la ligne de tendance.
+    df_sorted = _df_filtered.sort_values('date_publication')
+
+    fig_time = None
+
+    # Au-delà de 50k points, rastériser le nuage côté serveur : le coût de
+    # rendu devient O(pixels) au lieu de O(points)
+    if len(df_sorted) > 50000:
+        try:
+            import datashader as ds
+            import datashader.transfer_functions as tf
+        except ImportError:
+            # Dépendance optionnelle absente : retomber sur le rendu WebGL
+            pass
+        else:
+            # Le glyphe points de datashader refuse un x datetime64 :
+            # agréger sur la vue entière de la colonne de dates
+            date_arr = df_sorted['date_publication'].values
+            date_i8 = date_arr.view(np.int64)
+            prix = df_sorted['prix_eur'].to_numpy()
+            df_points = pd.DataFrame({'date_i8': date_i8, 'prix_eur': prix})
+            cvs = ds.Canvas(plot_width=900, plot_height=500)
+            agg = cvs.points(df_points, 'date_i8', 'prix_eur')
+            img = np.asarray(tf.shade(agg).to_pil())[::-1]
+            # dx en ms/pixel pour l'axe datetime de Plotly, converti depuis
+            # la résolution native du tableau (ns, us, ... selon pandas)
+            ticks_par_ms = np.timedelta64(1, 'ms') / np.timedelta64(1, np.datetime_data(date_arr.dtype)[0])
+            fig_time = go.Figure(
+                go.Image(
+                    z=img,
+                    x0=df_sorted['date_publication'].iloc[0],
+                    dx=(date_i8[-1] - date_i8[0]) / ticks_par_ms / 900,
+                    y0=float(prix.min()),
+                    dy=(float(prix.max()) - float(prix.min())) / 500,
+                    hoverinfo='skip'
+                )
+            )
+            # go.Image inverse l'axe y par défaut (convention image)
+            fig_time.update_yaxes(autorange=True)
+
+    if fig_time is None:
+        couleurs = df_sorted['type_vendeur'].map({
             'particulier': '#3498db',
             'professionnel': '#e74c3c'
-        }
-    )
-    
+        }).values
+
+        # Texte de survol concaténé de façon vectorisée côté serveur : une
+        # seule colonne de chaînes dans le JSON de la figure au lieu d'un
+        # tableau complet par colonne de hover_data
+        hover_text = (
+            '<b>' + df_sorted['titre'].astype(str) + '</b><br>' +
+            df_sorted['annee'].astype(str) + ' • ' +
+            df_sorted['kilometrage_km'].astype(str) + ' km<br>' +
+            df_sorted['ville'].astype(str)
+        )
+
+        # Tailles de marqueurs normalisées en float32, calculées une fois
+        # plutôt que par la boucle de mise à l'échelle par point de Plotly
+        km = df_sorted['kilometrage_km'].to_numpy(np.float32)
+        tailles = np.sqrt(km / km.max()) * 20.0 if len(km) else km
+
+        fig_time = go.Figure(
+            go.Scattergl(
+                x=df_sorted['date_publication'],
+                y=df_sorted['prix_eur'],
+                mode='markers',
+                marker=dict(
+                    color=couleurs,
+                    size=tailles
+                ),
+                text=hover_text,
+                hoverinfo='text',
+                name='Annonces'
+            )
+        )
+
     # Ajouter une ligne de tendance
-    if len(df_filtered) > 1:
-        # Convertir les dates en nombres pour la régression
-        df_filtered['date_num'] = (df_filtered['date_publication'] - df_filtered['date_publication'].min()).dt.days
-        z = np.polyfit(df_filtered['date_num'], df_filtered['prix_eur'], 1)
-        p = np.poly1d(z)
-        
+    if len(df_sorted) > 1:
+        # Régression linéaire en forme fermée sur float32 : un seul passage,
+        # sans la matrice de Vandermonde de np.polyfit. Les jours sont
+        # calculés en arithmétique datetime64 sans boxing en int Python.
+        date_arr = df_sorted['date_publication'].values
+        x = (date_arr - date_arr[0]).astype('timedelta64[D]').astype(np.int32).astype(np.float32)
+        y = df_sorted['prix_eur'].to_numpy(np.float32)
+        dx = x - x.mean()
+        slope = (dx * (y - y.mean())).sum() / (dx * dx).sum()
+        intercept = y.mean() - slope * x.mean()
+
         fig_time.add_trace(
             go.Scatter(
-                x=df_filtered.sort_values('date_publication')['date_publication'],
-                y=p(df_filtered.sort_values('date_publication')['date_num']),
+                x=df_sorted['date_publication'],
+                y=slope * x + intercept,
                 mode='lines',
                 name='Tendance',
                 line=dict(color='green', width=2, dash='dash')
             )
         )
-    
+
     fig_time.update_layout(
+        title="Prix des BMW Z3 par Date de Publication",
+        xaxis_title='Date de Publication',
+        yaxis_title='Prix (€)',
         height=500,
         hovermode='closest',
         showlegend=True
     )
-    
-    st.plotly_chart(fig_time, use_container_width=True)
-    
-    # Deuxième ligne de graphiques
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("💰 Prix vs Kilométrage")
-        fig_km = px.scatter(
-            df_filtered,
-            x='kilometrage_km',
-            y='prix_eur',
-            color='annee',
-            hover_data=['titre', 'ville', 'type_vendeur'],
-            title="Relation Prix-Kilométrage",
-            labels={
-                'kilometrage_km': 'Kilométrage (km)',
-                'prix_eur': 'Prix (€)',
-                'annee': 'Année'
-            },
-            color_continuous_scale='Viridis'
+
+    return fig_time
+
+@st.cache_data
+def build_km_figure(_df_filtered, filter_key):
+    fig_km = px.scatter(
+        _df_filtered,
+        x='kilometrage_km',
+        y='prix_eur',
+        color='annee',
+        hover_data=['titre', 'ville', 'type_vendeur'],
+        title="Relation Prix-Kilométrage",
+        labels={
+            'kilometrage_km': 'Kilométrage (km)',
+            'prix_eur': 'Prix (€)',
+            'annee': 'Année'
+        },
+        color_continuous_scale='Viridis'
+    )
+    fig_km.update_layout(height=400)
+    return fig_km
+
+@st.cache_data
+def build_annee_figure(_df_filtered, filter_key):
+    # Agrégation par np.bincount : les années forment une petite plage
+    # d'entiers, une seule boucle C remplace le groupby par table de hachage
+    years = _df_filtered['annee'].to_numpy(np.int32)
+    if len(years):
+        idx = years - years.min()
+        sums = np.bincount(idx, weights=_df_filtered['prix_eur'].to_numpy(np.float64))
+        counts = np.bincount(idx)
+        presentes = counts > 0
+        annees = np.arange(years.min(), years.min() + len(counts))[presentes]
+        moyennes = sums[presentes] / counts[presentes]
+    else:
+        annees = np.array([], dtype=np.int32)
+        moyennes = np.array([], dtype=np.float64)
+
+    fig_annee = go.Figure()
+    fig_annee.add_trace(
+        go.Bar(
+            x=annees,
+            y=moyennes,
+            name='Prix moyen',
+            marker_color='#2ecc71',
+            text=moyennes.round(0),
+            textposition='outside',
+            hovertemplate='Année: %{x}<br>Prix moyen: %{y:,.0f}€<extra></extra>'
         )
-        fig_km.update_layout(height=400)
-        st.plotly_chart(fig_km, use_container_width=True)
-    
-    with col2:
-        st.subheader("📅 Distribution par Année")
-        prix_par_annee = df_filtered.groupby('annee')['prix_eur'].agg(['mean', 'count']).reset_index()
-        
-        fig_annee = go.Figure()
-        fig_annee.add_trace(
-            go.Bar(
-                x=prix_par_annee['annee'],
-                y=prix_par_annee['mean'],
-                name='Prix moyen',
-                marker_color='#2ecc71',
-                text=prix_par_annee['mean'].round(0),
-                textposition='outside',
-                hovertemplate='Année: %{x}<br>Prix moyen: %{y:,.0f}€<extra></extra>'
-            )
+    )
+
+    fig_annee.update_layout(
+        title="Prix Moyen par Année de Fabrication",
+        xaxis_title="Année",
+        yaxis_title="Prix Moyen (€)",
+        height=400,
+        showlegend=False
+    )
+    return fig_annee
+
+@st.cache_data
+def build_hist_figure(_df_filtered, filter_key):
+    # Binning côté serveur : la figure ne transporte que ~20 hauteurs de
+    # barres au lieu de chaque prix brut que px.histogram embarque
+    counts, edges = np.histogram(_df_filtered['prix_eur'].to_numpy(), bins=20)
+
+    fig_hist = go.Figure(
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            marker_color='#9b59b6',
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
+            hovertemplate='%{customdata[0]:,.0f} – %{customdata[1]:,.0f} €<br>%{y} annonces<extra></extra>'
+        )
+    )
+    fig_hist.update_layout(
+        title="Distribution des Prix",
+        xaxis_title='Prix (€)',
+        yaxis_title='Nombre d\'annonces',
+        height=400,
+        showlegend=False,
+        bargap=0
+    )
+    return fig_hist
+
+# Charger les données
+try:
+    # Garder le DataFrame source en session pour ne pas le re-hasher, et
+    # ses colonnes de filtre en Structure-of-Arrays : des ndarrays contigus
+    # extraits une fois, sur lesquels le filtre travaille sans repasser par
+    # le dispatch pandas à chaque rerun
+    if 'df' not in st.session_state:
+        df, bounds = load_data()
+        st.session_state.df = df
+        st.session_state.bounds = bounds
+        st.session_state.cols = {
+            'date': df['date_publication'].values,
+            'annee': df['annee'].to_numpy(),
+            'km': df['kilometrage_km'].to_numpy(),
+            'prix': df['prix_eur'].to_numpy(),
+            'vendeur': df['type_vendeur'].cat.codes.to_numpy()
+        }
+    df = st.session_state.df
+    bounds = st.session_state.bounds
+
+    # Sidebar - Filtres, groupés dans un formulaire : le script ne refait le
+    # filtrage et les figures qu'au clic sur Appliquer, pas à chaque position
+    # intermédiaire d'un slider
+    with st.sidebar.form('filters'):
+        st.header("🔍 Filtres")
+
+        # Filtre par date de publication
+        st.subheader("Date de publication")
+        date_range = st.date_input(
+            "Période",
+            value=(bounds.date_min, bounds.date_max),
+            min_value=bounds.date_min,
+            max_value=bounds.date_max
         )
-        
-        fig_annee.update_layout(
-            title="Prix Moyen par Année de Fabrication",
-            xaxis_title="Année",
-            yaxis_title="Prix Moyen (€)",
-            height=400,
-            showlegend=False
+
+        # Filtre par année de fabrication
+        st.subheader("Année de fabrication")
+        annee_range = st.slider(
+            "Année",
+            min_value=bounds.annee_min,
+            max_value=bounds.annee_max,
+            value=(bounds.annee_min, bounds.annee_max)
+        )
+
+        # Filtre par kilométrage
+        st.subheader("Kilométrage")
+        km_range = st.slider(
+            "Kilométrage (km)",
+            min_value=bounds.km_min,
+            max_value=bounds.km_max,
+            value=(bounds.km_min, bounds.km_max),
+            step=1000
         )
-        st.plotly_chart(fig_annee, use_container_width=True)
+
+        # Filtre par prix
+        st.subheader("Prix")
+        prix_range = st.slider(
+            "Prix (€)",
+            min_value=bounds.prix_min,
+            max_value=bounds.prix_max,
+            value=(bounds.prix_min, bounds.prix_max),
+            step=500
+        )
+
+        # Filtre par type de vendeur
+        st.subheader("Type de vendeur")
+        type_vendeur = st.multiselect(
+            "Sélectionner",
+            options=df['type_vendeur'].cat.categories.tolist(),
+            default=df['type_vendeur'].cat.categories.tolist()
+        )
+
+        submitted = st.form_submit_button('Appliquer')
+
+    # Application des filtres : la clé de cache est le tuple de filtres,
+    # triée pour être insensible à l'ordre de sélection. Le dernier résultat
+    # reste en session tant que le formulaire n'est pas resoumis.
+    if submitted or 'df_filtered' not in st.session_state:
+        filter_key = (
+            tuple(date_range),
+            annee_range,
+            km_range,
+            prix_range,
+            tuple(sorted(type_vendeur))
+        )
+        st.session_state.df_filtered = apply_filters(df, st.session_state.cols, *filter_key)
+        st.session_state.filter_key = filter_key
+
+    df_filtered = st.session_state.df_filtered
+    filter_key = st.session_state.filter_key
     
-    # Distribution des prix
-    st.header("📊 Distribution des Prix")
+    # Statistiques principales
+    st.header("📊 Statistiques Clés")
     
-    fig_hist = px.histogram(
-        df_filtered,
-        x='prix_eur',
-        nbins=20,
-        title="Distribution des Prix",
-        labels={'prix_eur': 'Prix (€)', 'count': 'Nombre d\'annonces'},
-        color_discrete_sequence=['#9b59b6']
-    )
-    fig_hist.update_layout(height=400, showlegend=False)
-    st.plotly_chart(fig_hist, use_container_width=True)
+    col1, col2, col3, col4 = st.columns(4)
     
-    # Tableau de données
-    st.header("📋 Données Détaillées")
+    with col1:
+        st.metric("Nombre d'annonces", len(df_filtered))
     
-    # Préparer les données pour l'affichage
-    df_display = df_filtered[[
-        'titre', 'date_publication', 'annee', 'kilometrage_km', 
-        'prix_eur', 'ville', 'type_vendeur', 'url'
-    ]].copy()
+    with col2:
+        st.metric("Prix moyen", f"{df_filtered['prix_eur'].mean():,.0f} €")
     
-    df_display['date_publication'] = df_display['date_publication'].dt.strftime('%d/%m/%Y')
-    df_display = df_display.sort_values('date_publication', ascending=False)
+    with col3:
+        st.metric("Prix médian", f"{df_filtered['prix_eur'].median():,.0f} €")
     
-    # Renommer les colonnes pour l'affichage
-    df_display.columns = [
-        'Titre', 'Date Publication', 'Année', 'Kilométrage (km)',
-        'Prix (€)', 'Ville', 'Type Vendeur', 'URL'
-    ]
+    with col4:
+        st.metric("Kilométrage moyen", f"{df_filtered['kilometrage_km'].mean():,.0f} km")
     
-    st.dataframe(
-        df_display,
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            "URL": st.column_config.LinkColumn("Lien"),
-            "Prix (€)": st.column_config.NumberColumn(
-                "Prix (€)",
-                format="%d €"
-            ),
-            "Kilométrage (km)": st.column_config.NumberColumn(
-                "Kilométrage (km)",
-                format="%d km"
-            )
-        }
-    )
+    st.markdown("---")
+
+    # Un onglet par graphique. Attention : st.tabs transmet le contenu de
+    # tous les onglets à chaque rerun (la bascule est purement côté client) ;
+    # c'est le cache des builders et le formulaire qui évitent le recalcul,
+    # les onglets ne servent qu'à la mise en page.
+    tab_temps, tab_km, tab_annee, tab_dist, tab_donnees = st.tabs([
+        '📈 Temps', '💰 Prix vs Km', '📅 Par Année', '📊 Distribution', '📋 Données'
+    ])
+
+    with tab_temps:
+        st.header("📈 Évolution des Prix au Fil du Temps")
+        st.plotly_chart(build_time_figure(df_filtered, filter_key), use_container_width=True)
+
+    with tab_km:
+        st.header("💰 Prix vs Kilométrage")
+        st.plotly_chart(build_km_figure(df_filtered, filter_key), use_container_width=True)
+
+    with tab_annee:
+        st.header("📅 Distribution par Année")
+        st.plotly_chart(build_annee_figure(df_filtered, filter_key), use_container_width=True)
+
+    with tab_dist:
+        st.header("📊 Distribution des Prix")
+        st.plotly_chart(build_hist_figure(df_filtered, filter_key), use_container_width=True)
+
+    with tab_donnees:
+        st.header("📋 Données Détaillées")
+
+        # Préparer les données pour l'affichage : trier d'abord sur la
+        # colonne datetime64 (tri int64 natif et ordre chronologique
+        # correct), puis formater en texte — l'inverse triait les chaînes
+        # 'JJ/MM/AAAA' lexicographiquement
+        df_display = df_filtered.sort_values('date_publication', ascending=False)[[
+            'titre', 'date_publication', 'annee', 'kilometrage_km',
+            'prix_eur', 'ville', 'type_vendeur', 'url'
+        ]].copy()
+
+        df_display['date_publication'] = df_display['date_publication'].dt.strftime('%d/%m/%Y')
+
+        # Renommer les colonnes pour l'affichage
+        df_display.columns = [
+            'Titre', 'Date Publication', 'Année', 'Kilométrage (km)',
+            'Prix (€)', 'Ville', 'Type Vendeur', 'URL'
+        ]
+
+        # N'envoyer au navigateur que les premières lignes : le tableau
+        # filtré peut compter des milliers de lignes alors qu'une vingtaine
+        # sont visibles à la fois
+        N_AFFICHAGE = 500
+        tout_afficher = st.checkbox(
+            'Tout afficher',
+            disabled=len(df_display) <= N_AFFICHAGE
+        )
+
+        st.dataframe(
+            df_display if tout_afficher else df_display.head(N_AFFICHAGE),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "URL": st.column_config.LinkColumn("Lien"),
+                "Prix (€)": st.column_config.NumberColumn(
+                    "Prix (€)",
+                    format="%d €"
+                ),
+                "Kilométrage (km)": st.column_config.NumberColumn(
+                    "Kilométrage (km)",
+                    format="%d km"
+                )
+            }
+        )
     
     # Informations supplémentaires
     st.markdown("---")